@@ -12,12 +12,13 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+from types import SimpleNamespace
 
 import pytest
 
 import sagemaker
 
-from mock import Mock, PropertyMock
+from mock import Mock
 
 _ROLE = "DummyRole"
 _REGION = "us-west-2"
@@ -34,19 +35,20 @@ def client():
          * separate runtime client from client
     """
     client_mock = Mock()
-    client_mock._client_config.user_agent = (
-        "Boto3/1.14.24 Python/3.8.5 Linux/5.4.0-42-generic Botocore/1.17.24 Resource"
+    client_mock._client_config = SimpleNamespace(
+        user_agent="Boto3/1.14.24 Python/3.8.5 Linux/5.4.0-42-generic Botocore/1.17.24 Resource"
     )
     return client_mock
 
 
 @pytest.fixture(scope="session")
 def boto_session(client):
-    role_mock = Mock()
-    type(role_mock).arn = PropertyMock(return_value=_ROLE)
-
+    # The IAM role only ever has .arn read off it (session.py touches
+    # resource("iam").Role(role).arn), so a SimpleNamespace is enough; the
+    # resource mock itself stays a Mock since other code paths (e.g. the s3
+    # resource) rely on auto-created attributes.
     resource_mock = Mock()
-    resource_mock.Role.return_value = role_mock
+    resource_mock.Role.return_value = SimpleNamespace(arn=_ROLE)
 
     session_mock = Mock(region_name=_REGION)
     session_mock.resource.return_value = resource_mock
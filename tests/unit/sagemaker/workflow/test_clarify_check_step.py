@@ -14,30 +14,31 @@ from __future__ import absolute_import
 
 import json
 import re
+from types import MappingProxyType
+
 import pytest
 
 from sagemaker.clarify import (
-    DataConfig,
     BiasConfig,
+    DataConfig,
     ModelConfig,
     ModelPredictedLabelConfig,
     SHAPConfig,
 )
+from sagemaker.model_monitor.model_monitoring import _MODEL_MONITOR_S3_PATH
+from sagemaker.workflow.check_job_config import CheckJobConfig
 from sagemaker.workflow.clarify_check_step import (
-    DataBiasCheckConfig,
+    _BIAS_MONITORING_CFG_BASE_NAME,
+    _EXPLAINABILITY_MONITORING_CFG_BASE_NAME,
+    ClarifyCheckConfig,
     ClarifyCheckStep,
+    DataBiasCheckConfig,
     ModelBiasCheckConfig,
     ModelExplainabilityCheckConfig,
-    ClarifyCheckConfig,
-    _EXPLAINABILITY_MONITORING_CFG_BASE_NAME,
-    _BIAS_MONITORING_CFG_BASE_NAME,
 )
-from sagemaker.model_monitor.model_monitoring import _MODEL_MONITOR_S3_PATH
 from sagemaker.workflow.parameters import ParameterString
-from sagemaker.workflow.pipeline import Pipeline
-from sagemaker.workflow.pipeline import PipelineDefinitionConfig
+from sagemaker.workflow.pipeline import Pipeline, PipelineDefinitionConfig
 from sagemaker.workflow.steps import CacheConfig
-from sagemaker.workflow.check_job_config import CheckJobConfig
 
 _REGION = "us-west-2"
 _ROLE = "DummyRole"
@@ -47,77 +48,79 @@ _S3_OUTPUT_PATH = "s3://my_bucket/output"
 _S3_ANALYSIS_CONFIG_OUTPUT_PATH = "s3://my_bucket/analysis_cfg_output"
 _CHECK_JOB_PREFIX = "CheckJobPrefix"
 
+# Expected error messages, hoisted so the raising tests share one constant
+# per message instead of re-assembling the literals at each assertion site.
+_ERR_INVALID_CONFIG = (
+    "The clarify_check_config can only be object of DataBiasCheckConfig, ModelBiasCheckConfig"
+    " or ModelExplainabilityCheckConfig"
+)
+_ERR_PARAM_S3_OUTPUT_PATH = (
+    "`s3_output_path` cannot be of type ExecutionVariable/Expression/Parameter/Properties "
+    "if `s3_analysis_config_output_path` is none or empty "
+)
+_ERR_PARAM_ANALYSIS_CONFIG_OUTPUT_PATH = (
+    "s3_analysis_config_output_path cannot be of type "
+    "ExecutionVariable/Expression/Parameter/Properties"
+)
 
-_expected_data_bias_dsl = {
-    "Name": "DataBiasCheckStep",
-    "Type": "ClarifyCheck",
-    "Arguments": {
-        "ProcessingJobName": _CHECK_JOB_PREFIX,
-        "ProcessingResources": {
-            "ClusterConfig": {
-                "InstanceType": "ml.m5.xlarge",
-                "InstanceCount": 1,
-                "VolumeSizeInGB": 30,
-            }
-        },
-        "AppSpecification": {
-            "ImageUri": "306415355426.dkr.ecr.us-west-2.amazonaws.com/sagemaker-clarify-processing:1.0"
-        },
-        "RoleArn": "DummyRole",
-        "ProcessingInputs": [
-            {
-                "InputName": "analysis_config",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_ANALYSIS_CONFIG_OUTPUT_PATH}/analysis_config.json",
-                    "LocalPath": "/opt/ml/processing/input/config",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
+
+# Compiled once at module load; re-parsing the patterns per test would only
+# exercise the bounded re module cache.
+_MONITORING_URI_PATTERNS = {
+    "data_bias": re.compile(
+        f"{_S3_ANALYSIS_CONFIG_OUTPUT_PATH}/{_BIAS_MONITORING_CFG_BASE_NAME}-configuration"
+        f"/{_BIAS_MONITORING_CFG_BASE_NAME}-config.*/.*/analysis_config.json"
+    ),
+    "model_bias": re.compile(
+        f"s3://{_DEFAULT_BUCKET}/{_MODEL_MONITOR_S3_PATH}"
+        f"/{_BIAS_MONITORING_CFG_BASE_NAME}-configuration"
+        f"/{_BIAS_MONITORING_CFG_BASE_NAME}-config.*/.*/analysis_config.json"
+    ),
+    "model_explainability": re.compile(
+        f"s3://{_DEFAULT_BUCKET}/{_MODEL_MONITOR_S3_PATH}"
+        f"/{_EXPLAINABILITY_MONITORING_CFG_BASE_NAME}-configuration"
+        f"/{_EXPLAINABILITY_MONITORING_CFG_BASE_NAME}-config-.*/.*/analysis_config.json"
+    ),
+}
+
+
+def _expected_processing_inputs(analysis_config_s3_uri):
+    """The common ProcessingInputs block; only the analysis config uri differs."""
+    return [
+        {
+            "InputName": "analysis_config",
+            "AppManaged": False,
+            "S3Input": {
+                "S3Uri": analysis_config_s3_uri,
+                "LocalPath": "/opt/ml/processing/input/config",
+                "S3DataType": "S3Prefix",
+                "S3InputMode": "File",
+                "S3DataDistributionType": "FullyReplicated",
+                "S3CompressionType": "None",
             },
-            {
-                "InputName": "dataset",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_INPUT_PATH}",
-                    "LocalPath": "/opt/ml/processing/input/data",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
+        },
+        {
+            "InputName": "dataset",
+            "AppManaged": False,
+            "S3Input": {
+                "S3Uri": f"{_S3_INPUT_PATH}",
+                "LocalPath": "/opt/ml/processing/input/data",
+                "S3DataType": "S3Prefix",
+                "S3InputMode": "File",
+                "S3DataDistributionType": "FullyReplicated",
+                "S3CompressionType": "None",
             },
-        ],
-        "ProcessingOutputConfig": {
-            "Outputs": [
-                {
-                    "OutputName": "analysis_result",
-                    "AppManaged": False,
-                    "S3Output": {
-                        "S3Uri": f"{_S3_OUTPUT_PATH}",
-                        "LocalPath": "/opt/ml/processing/output",
-                        "S3UploadMode": "EndOfJob",
-                    },
-                }
-            ],
-            "KmsKeyId": "output_kms_key",
         },
-    },
-    "CheckType": "DATA_BIAS",
-    "ModelPackageGroupName": {"Get": "Parameters.MyModelPackageGroup"},
-    "SkipCheck": False,
-    "FailOnViolation": False,
-    "RegisterNewBaseline": False,
-    "SuppliedBaselineConstraints": "supplied_baseline_constraints",
-    "CacheConfig": {"Enabled": True, "ExpireAfter": "PT1H"},
-}
+    ]
 
-_expected_model_bias_dsl = {
-    "Name": "ModelBiasCheckStep",
-    "Type": "ClarifyCheck",
-    "Arguments": {
+
+# Blocks shared verbatim by the three expected step DSL dicts below. These are
+# builder functions rather than shared constants (like _expected_processing_inputs
+# above) so each expected dict gets its own fresh nested structures; the
+# MappingProxyType wrap only freezes the top level, so sharing the nested
+# blocks would let a mutation in one test leak into the others.
+def _common_arguments():
+    return {
         "ProcessingResources": {
             "ClusterConfig": {
                 "InstanceType": "ml.m5.xlarge",
@@ -128,33 +131,7 @@ _expected_model_bias_dsl = {
         "AppSpecification": {
             "ImageUri": "306415355426.dkr.ecr.us-west-2.amazonaws.com/sagemaker-clarify-processing:1.0"
         },
-        "RoleArn": "DummyRole",
-        "ProcessingInputs": [
-            {
-                "InputName": "analysis_config",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_OUTPUT_PATH}/analysis_config.json",
-                    "LocalPath": "/opt/ml/processing/input/config",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
-            },
-            {
-                "InputName": "dataset",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_INPUT_PATH}",
-                    "LocalPath": "/opt/ml/processing/input/data",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
-            },
-        ],
+        "RoleArn": _ROLE,
         "ProcessingOutputConfig": {
             "Outputs": [
                 {
@@ -169,88 +146,114 @@ _expected_model_bias_dsl = {
             ],
             "KmsKeyId": "output_kms_key",
         },
-    },
-    "CheckType": "MODEL_BIAS",
-    "ModelPackageGroupName": {"Get": "Parameters.MyModelPackageGroup"},
-    "SkipCheck": False,
-    "FailOnViolation": True,
-    "RegisterNewBaseline": False,
-    "SuppliedBaselineConstraints": "supplied_baseline_constraints",
-    "ModelName": "model_name",
-}
+    }
 
-_expected_model_explainability_dsl = {
-    "Name": "ModelExplainabilityCheckStep",
-    "Type": "ClarifyCheck",
-    "Arguments": {
-        "ProcessingResources": {
-            "ClusterConfig": {
-                "InstanceType": "ml.m5.xlarge",
-                "InstanceCount": 1,
-                "VolumeSizeInGB": 30,
-            }
+
+def _common_step_dsl():
+    return {
+        "Type": "ClarifyCheck",
+        "ModelPackageGroupName": {"Get": "Parameters.MyModelPackageGroup"},
+        "SkipCheck": False,
+        "RegisterNewBaseline": False,
+        "SuppliedBaselineConstraints": "supplied_baseline_constraints",
+    }
+
+
+_expected_data_bias_dsl = MappingProxyType(
+    {
+        **_common_step_dsl(),
+        "Name": "DataBiasCheckStep",
+        "Arguments": {
+            "ProcessingJobName": _CHECK_JOB_PREFIX,
+            **_common_arguments(),
+            "ProcessingInputs": _expected_processing_inputs(
+                f"{_S3_ANALYSIS_CONFIG_OUTPUT_PATH}/analysis_config.json"
+            ),
         },
-        "AppSpecification": {
-            "ImageUri": "306415355426.dkr.ecr.us-west-2.amazonaws.com/sagemaker-clarify-processing:1.0"
+        "CheckType": "DATA_BIAS",
+        "FailOnViolation": False,
+        "CacheConfig": {"Enabled": True, "ExpireAfter": "PT1H"},
+    }
+)
+
+_expected_model_bias_dsl = MappingProxyType(
+    {
+        **_common_step_dsl(),
+        "Name": "ModelBiasCheckStep",
+        "Arguments": {
+            **_common_arguments(),
+            "ProcessingInputs": _expected_processing_inputs(
+                f"{_S3_OUTPUT_PATH}/analysis_config.json"
+            ),
         },
-        "RoleArn": "DummyRole",
-        "ProcessingInputs": [
-            {
-                "InputName": "analysis_config",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_OUTPUT_PATH}/analysis_config.json",
-                    "LocalPath": "/opt/ml/processing/input/config",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
-            },
-            {
-                "InputName": "dataset",
-                "AppManaged": False,
-                "S3Input": {
-                    "S3Uri": f"{_S3_INPUT_PATH}",
-                    "LocalPath": "/opt/ml/processing/input/data",
-                    "S3DataType": "S3Prefix",
-                    "S3InputMode": "File",
-                    "S3DataDistributionType": "FullyReplicated",
-                    "S3CompressionType": "None",
-                },
-            },
-        ],
-        "ProcessingOutputConfig": {
-            "Outputs": [
-                {
-                    "OutputName": "analysis_result",
-                    "AppManaged": False,
-                    "S3Output": {
-                        "S3Uri": f"{_S3_OUTPUT_PATH}",
-                        "LocalPath": "/opt/ml/processing/output",
-                        "S3UploadMode": "EndOfJob",
-                    },
-                }
-            ],
-            "KmsKeyId": "output_kms_key",
+        "CheckType": "MODEL_BIAS",
+        "FailOnViolation": True,
+        "ModelName": "model_name",
+    }
+)
+
+_expected_model_explainability_dsl = MappingProxyType(
+    {
+        **_common_step_dsl(),
+        "Name": "ModelExplainabilityCheckStep",
+        "Arguments": {
+            **_common_arguments(),
+            "ProcessingInputs": _expected_processing_inputs(
+                f"{_S3_OUTPUT_PATH}/analysis_config.json"
+            ),
         },
-    },
-    "CheckType": "MODEL_EXPLAINABILITY",
-    "ModelPackageGroupName": {"Get": "Parameters.MyModelPackageGroup"},
-    "SkipCheck": False,
-    "FailOnViolation": False,
-    "RegisterNewBaseline": False,
-    "SuppliedBaselineConstraints": "supplied_baseline_constraints",
-    "ModelName": "model_name",
-}
+        "CheckType": "MODEL_EXPLAINABILITY",
+        "FailOnViolation": False,
+        "ModelName": "model_name",
+    }
+)
 
 
-@pytest.fixture
+# Singleton ParameterString; it is effectively immutable for these tests, so
+# one instance serves every module that parametrizes the pipeline with it.
+_MODEL_PACKAGE_GROUP_PARAM = ParameterString(name="MyModelPackageGroup", default_value="")
+
+
+@pytest.fixture(scope="module")
 def model_package_group_name():
-    return ParameterString(name="MyModelPackageGroup", default_value="")
+    return _MODEL_PACKAGE_GROUP_PARAM
+
+
+@pytest.fixture
+def build_pipeline(sagemaker_session, model_package_group_name):
+    """Factory for the single-step pipeline shared by the success-path tests."""
+
+    def _build(step, pipeline_definition_config=None):
+        kwargs = dict(
+            name="MyPipeline",
+            parameters=[model_package_group_name],
+            steps=[step],
+            sagemaker_session=sagemaker_session,
+        )
+        if pipeline_definition_config is not None:
+            kwargs["pipeline_definition_config"] = pipeline_definition_config
+        return Pipeline(**kwargs)
+
+    return _build
 
 
 @pytest.fixture
+def pipeline_def(build_pipeline):
+    """Factory returning the parsed pipeline definition for a given step.
+
+    ``ClarifyCheckStep.to_request()`` is no shortcut here: parameter
+    interpolation to ``{"Get": ...}`` form and the ProcessingJobName trimming
+    both happen only while the full definition is serialized.
+    """
+
+    def _get(step, pipeline_definition_config=None):
+        pipeline = build_pipeline(step, pipeline_definition_config)
+        return json.loads(pipeline.definition())
+
+    return _get
+
+
+@pytest.fixture(scope="module")
 def check_job_config(sagemaker_session):
     return CheckJobConfig(
         role=_ROLE,
@@ -262,7 +265,7 @@ def check_job_config(sagemaker_session):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_config():
     return DataConfig(
         s3_data_input_path=_S3_INPUT_PATH,
@@ -272,7 +275,19 @@ def data_config():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
+def data_bias_data_config():
+    """The DataConfig variant with an explicit s3_analysis_config_output_path."""
+    return DataConfig(
+        s3_data_input_path=_S3_INPUT_PATH,
+        s3_output_path=_S3_OUTPUT_PATH,
+        s3_analysis_config_output_path=_S3_ANALYSIS_CONFIG_OUTPUT_PATH,
+        label="fraud",
+        dataset_type="text/csv",
+    )
+
+
+@pytest.fixture(scope="module")
 def bias_config():
     return BiasConfig(
         label_values_or_threshold=[0],
@@ -281,7 +296,7 @@ def bias_config():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def model_config():
     return ModelConfig(
         model_name="model_name",
@@ -292,12 +307,12 @@ def model_config():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def predictions_config():
     return ModelPredictedLabelConfig(probability_threshold=0.8)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def shap_config():
     return SHAPConfig(
         baseline=[],
@@ -307,130 +322,85 @@ def shap_config():
     )
 
 
-def test_data_bias_check_step(
-    sagemaker_session, check_job_config, model_package_group_name, bias_config
-):
-    data_bias_data_config = DataConfig(
-        s3_data_input_path=_S3_INPUT_PATH,
-        s3_output_path=_S3_OUTPUT_PATH,
-        s3_analysis_config_output_path=_S3_ANALYSIS_CONFIG_OUTPUT_PATH,
-        label="fraud",
-        dataset_type="text/csv",
-    )
-    data_bias_check_config = DataBiasCheckConfig(
+@pytest.fixture
+def data_bias_check_config(data_bias_data_config, bias_config):
+    return DataBiasCheckConfig(
         data_config=data_bias_data_config,
         data_bias_config=bias_config,
         methods="all",
         kms_key="kms_key",
     )
-    data_bias_check_step = ClarifyCheckStep(
-        name="DataBiasCheckStep",
-        clarify_check_config=data_bias_check_config,
-        check_job_config=check_job_config,
-        skip_check=False,
-        fail_on_violation=False,
-        register_new_baseline=False,
-        model_package_group_name=model_package_group_name,
-        supplied_baseline_constraints="supplied_baseline_constraints",
-        cache_config=CacheConfig(enable_caching=True, expire_after="PT1H"),
-    )
-
-    definition_config = PipelineDefinitionConfig(use_custom_job_prefix=True)
-    pipeline = Pipeline(
-        name="MyPipeline",
-        parameters=[model_package_group_name],
-        steps=[data_bias_check_step],
-        sagemaker_session=sagemaker_session,
-        pipeline_definition_config=definition_config,
-    )
 
-    step_def = json.loads(pipeline.definition())["Steps"][0]
-    assert step_def == _expected_data_bias_dsl
-    assert re.match(
-        f"{_S3_ANALYSIS_CONFIG_OUTPUT_PATH}/{_BIAS_MONITORING_CFG_BASE_NAME}-configuration"
-        + f"/{_BIAS_MONITORING_CFG_BASE_NAME}-config.*/.*/analysis_config.json",
-        data_bias_check_config.monitoring_analysis_config_uri,
-    )
 
-
-def test_model_bias_check_step(
-    sagemaker_session,
-    check_job_config,
-    model_package_group_name,
-    data_config,
-    bias_config,
-    model_config,
-    predictions_config,
-):
-    model_bias_check_config = ModelBiasCheckConfig(
+@pytest.fixture
+def model_bias_check_config(data_config, bias_config, model_config, predictions_config):
+    return ModelBiasCheckConfig(
         data_config=data_config,
         data_bias_config=bias_config,
         model_config=model_config,
         model_predicted_label_config=predictions_config,
         methods="all",
     )
-    model_bias_check_step = ClarifyCheckStep(
-        name="ModelBiasCheckStep",
-        clarify_check_config=model_bias_check_config,
-        check_job_config=check_job_config,
-        skip_check=False,
-        fail_on_violation=True,
-        register_new_baseline=False,
-        model_package_group_name=model_package_group_name,
-        supplied_baseline_constraints="supplied_baseline_constraints",
-    )
-    pipeline = Pipeline(
-        name="MyPipeline",
-        parameters=[model_package_group_name],
-        steps=[model_bias_check_step],
-        sagemaker_session=sagemaker_session,
-    )
 
-    assert json.loads(pipeline.definition())["Steps"][0] == _expected_model_bias_dsl
-    assert re.match(
-        f"s3://{_DEFAULT_BUCKET}/{_MODEL_MONITOR_S3_PATH}"
-        + f"/{_BIAS_MONITORING_CFG_BASE_NAME}-configuration"
-        + f"/{_BIAS_MONITORING_CFG_BASE_NAME}-config.*/.*/analysis_config.json",
-        model_bias_check_config.monitoring_analysis_config_uri,
+
+@pytest.fixture
+def model_explainability_check_config(data_config, model_config, shap_config):
+    return ModelExplainabilityCheckConfig(
+        data_config=data_config,
+        model_config=model_config,
+        explainability_config=shap_config,
     )
 
 
-def test_model_explainability_check_step(
-    sagemaker_session,
+@pytest.mark.parametrize(
+    "check_type, step_name, expected_dsl, fail_on_violation, with_cache_config, custom_job_prefix",
+    [
+        ("data_bias", "DataBiasCheckStep", _expected_data_bias_dsl, False, True, True),
+        ("model_bias", "ModelBiasCheckStep", _expected_model_bias_dsl, True, False, False),
+        (
+            "model_explainability",
+            "ModelExplainabilityCheckStep",
+            _expected_model_explainability_dsl,
+            False,
+            False,
+            False,
+        ),
+    ],
+)
+def test_clarify_check_step(
+    request,
+    pipeline_def,
     check_job_config,
     model_package_group_name,
-    data_config,
-    model_config,
-    shap_config,
+    check_type,
+    step_name,
+    expected_dsl,
+    fail_on_violation,
+    with_cache_config,
+    custom_job_prefix,
 ):
-    model_explainability_check_config = ModelExplainabilityCheckConfig(
-        data_config=data_config,
-        model_config=model_config,
-        explainability_config=shap_config,
-    )
-    model_explainability_check_step = ClarifyCheckStep(
-        name="ModelExplainabilityCheckStep",
-        clarify_check_config=model_explainability_check_config,
+    clarify_check_config = request.getfixturevalue(f"{check_type}_check_config")
+    check_step = ClarifyCheckStep(
+        name=step_name,
+        clarify_check_config=clarify_check_config,
         check_job_config=check_job_config,
         skip_check=False,
-        fail_on_violation=False,
+        fail_on_violation=fail_on_violation,
         register_new_baseline=False,
         model_package_group_name=model_package_group_name,
         supplied_baseline_constraints="supplied_baseline_constraints",
+        cache_config=(
+            CacheConfig(enable_caching=True, expire_after="PT1H") if with_cache_config else None
+        ),
     )
-    pipeline = Pipeline(
-        name="MyPipeline",
-        parameters=[model_package_group_name],
-        steps=[model_explainability_check_step],
-        sagemaker_session=sagemaker_session,
-    )
+    step_def = pipeline_def(
+        check_step,
+        PipelineDefinitionConfig(use_custom_job_prefix=True) if custom_job_prefix else None,
+    )["Steps"][0]
 
-    assert json.loads(pipeline.definition())["Steps"][0] == _expected_model_explainability_dsl
-    assert re.match(
-        f"s3://{_DEFAULT_BUCKET}/{_MODEL_MONITOR_S3_PATH}"
-        + f"/{_EXPLAINABILITY_MONITORING_CFG_BASE_NAME}-configuration"
-        + f"/{_EXPLAINABILITY_MONITORING_CFG_BASE_NAME}-config-.*/.*/analysis_config.json",
-        model_explainability_check_config.monitoring_analysis_config_uri,
+    assert step_def == expected_dsl
+    assert _MONITORING_URI_PATTERNS[check_type].match(
+        clarify_check_config.monitoring_analysis_config_uri
     )
 
 
@@ -440,7 +410,18 @@ def test_clarify_check_step_properties(
     data_config,
     model_config,
     shap_config,
+    monkeypatch,
 ):
+    # This test only reads .properties, so skip the analysis-config generation
+    # and s3 upload work that otherwise dominates ClarifyCheckStep.__init__.
+    monkeypatch.setattr(ClarifyCheckStep, "_upload_monitoring_analysis_config", lambda self: None)
+    monkeypatch.setattr(
+        ClarifyCheckStep, "_generate_processing_job_analysis_config", lambda self: {}
+    )
+    monkeypatch.setattr(
+        ClarifyCheckStep, "_generate_processing_job_parameters", lambda self, *args: {}
+    )
+
     model_explainability_check_config = ModelExplainabilityCheckConfig(
         data_config=data_config,
         model_config=model_config,
@@ -474,7 +455,7 @@ def test_clarify_check_step_invalid_config(
     data_config,
 ):
     clarify_check_config = ClarifyCheckConfig(data_config=data_config)
-    with pytest.raises(Exception) as error:
+    with pytest.raises(Exception, match=re.escape(_ERR_INVALID_CONFIG)):
         ClarifyCheckStep(
             name="ClarifyCheckStep",
             clarify_check_config=clarify_check_config,
@@ -485,85 +466,60 @@ def test_clarify_check_step_invalid_config(
             supplied_baseline_constraints="supplied_baseline_constraints",
         )
 
-    assert (
-        str(error.value)
-        == "The clarify_check_config can only be object of DataBiasCheckConfig, ModelBiasCheckConfig"
-        " or ModelExplainabilityCheckConfig"
+
+@pytest.fixture(
+    params=["none_analysis_output", "param_s3_output_empty_analysis", "param_analysis_output"]
+)
+def analysis_config_output_case(request, bias_config):
+    """DataBiasCheckConfig variants exercising s3_analysis_config_output_path.
+
+    Returns the check config together with the error message ClarifyCheckStep
+    is expected to raise for it (None for the valid variant).
+    """
+    if request.param == "none_analysis_output":
+        # s3_analysis_config_output is None and s3_output_path is valid s3 path str
+        data_config = DataConfig(
+            s3_data_input_path=_S3_INPUT_PATH,
+            s3_output_path=_S3_OUTPUT_PATH,
+            label="fraud",
+            dataset_type="text/csv",
+        )
+        expected_error = None
+    elif request.param == "param_s3_output_empty_analysis":
+        # s3_analysis_config_output is empty but s3_output_path is Parameter
+        data_config = DataConfig(
+            s3_data_input_path=_S3_INPUT_PATH,
+            s3_output_path=ParameterString(name="S3OutputPath", default_value=_S3_OUTPUT_PATH),
+            s3_analysis_config_output_path="",
+            label="fraud",
+            dataset_type="text/csv",
+        )
+        expected_error = _ERR_PARAM_S3_OUTPUT_PATH
+    else:
+        # s3_analysis_config_output is invalid
+        data_config = DataConfig(
+            s3_data_input_path=_S3_INPUT_PATH,
+            s3_output_path=ParameterString(name="S3OutputPath", default_value=_S3_OUTPUT_PATH),
+            s3_analysis_config_output_path=ParameterString(name="S3OAnalysisCfgOutput"),
+            label="fraud",
+            dataset_type="text/csv",
+        )
+        expected_error = _ERR_PARAM_ANALYSIS_CONFIG_OUTPUT_PATH
+    return (
+        DataBiasCheckConfig(data_config=data_config, data_bias_config=bias_config),
+        expected_error,
     )
 
 
 def test_clarify_check_step_with_none_or_invalid_s3_analysis_config_output_uri(
-    bias_config,
+    analysis_config_output_case,
     check_job_config,
     model_package_group_name,
 ):
-    # s3_analysis_config_output is None and s3_output_path is valid s3 path str
-    data_config = DataConfig(
-        s3_data_input_path=_S3_INPUT_PATH,
-        s3_output_path=_S3_OUTPUT_PATH,
-        label="fraud",
-        dataset_type="text/csv",
-    )
-    clarify_check_config = DataBiasCheckConfig(
-        data_config=data_config,
-        data_bias_config=bias_config,
-    )
-
-    ClarifyCheckStep(
-        name="ClarifyCheckStep",
-        clarify_check_config=clarify_check_config,
-        check_job_config=check_job_config,
-        skip_check=False,
-        register_new_baseline=False,
-        model_package_group_name=model_package_group_name,
-        supplied_baseline_constraints="supplied_baseline_constraints",
-    )
-
-    # s3_analysis_config_output is empty but s3_output_path is Parameter
-    data_config = DataConfig(
-        s3_data_input_path=_S3_INPUT_PATH,
-        s3_output_path=ParameterString(name="S3OutputPath", default_value=_S3_OUTPUT_PATH),
-        s3_analysis_config_output_path="",
-        label="fraud",
-        dataset_type="text/csv",
-    )
-    clarify_check_config = DataBiasCheckConfig(
-        data_config=data_config,
-        data_bias_config=bias_config,
-    )
-
-    with pytest.raises(Exception) as error:
-        ClarifyCheckStep(
-            name="ClarifyCheckStep",
-            clarify_check_config=clarify_check_config,
-            check_job_config=check_job_config,
-            skip_check=False,
-            register_new_baseline=False,
-            model_package_group_name=model_package_group_name,
-            supplied_baseline_constraints="supplied_baseline_constraints",
-        )
+    clarify_check_config, expected_error = analysis_config_output_case
 
-    assert (
-        str(error.value)
-        == "`s3_output_path` cannot be of type ExecutionVariable/Expression/Parameter/Properties "
-        + "if `s3_analysis_config_output_path` is none or empty "
-    )
-
-    # s3_analysis_config_output is invalid
-    data_config = DataConfig(
-        s3_data_input_path=_S3_INPUT_PATH,
-        s3_output_path=ParameterString(name="S3OutputPath", default_value=_S3_OUTPUT_PATH),
-        s3_analysis_config_output_path=ParameterString(name="S3OAnalysisCfgOutput"),
-        label="fraud",
-        dataset_type="text/csv",
-    )
-    clarify_check_config = DataBiasCheckConfig(
-        data_config=data_config,
-        data_bias_config=bias_config,
-    )
-
-    with pytest.raises(Exception) as error:
-        ClarifyCheckStep(
+    def _build_step():
+        return ClarifyCheckStep(
             name="ClarifyCheckStep",
             clarify_check_config=clarify_check_config,
             check_job_config=check_job_config,
@@ -573,10 +529,11 @@ def test_clarify_check_step_with_none_or_invalid_s3_analysis_config_output_uri(
             supplied_baseline_constraints="supplied_baseline_constraints",
         )
 
-    assert (
-        str(error.value) == "s3_analysis_config_output_path cannot be of type "
-        "ExecutionVariable/Expression/Parameter/Properties"
-    )
+    if expected_error is None:
+        _build_step()
+    else:
+        with pytest.raises(Exception, match=re.escape(expected_error)):
+            _build_step()
 
 
 def test_get_s3_base_uri_for_monitoring_analysis_config(